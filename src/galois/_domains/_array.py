@@ -60,7 +60,8 @@ class Array(LinalgFunctionMixin, FunctionMixin, UFuncMixin, np.ndarray, metaclas
 
         # Perform view without verification since the elements were verified in _verify_array_like_types_and_values()
         galois_array = cls._view(array)
-        galois_array.original_shape = x.shape
+        if cls._bitpacked:
+            galois_array._unpacked_shape = np.shape(x)
         return galois_array
 
     @classmethod
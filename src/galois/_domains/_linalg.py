@@ -50,7 +50,12 @@ def _lapack_linalg(field: Type[Array], a: Array, b: Array, function, out=None, n
         c = function(a, b)
     else:
         c = function(a, b, out=out)
-    c = c % field.characteristic  # Reduce the result mod p
+    # Reduce the result mod p. In GF(2) a bitwise AND is used since it avoids the much slower divmod
+    # kernel (the scalar result can be a float, so only arrays take the bitwise path).
+    if field.characteristic == 2 and not np.isscalar(c):
+        c = c & 1
+    else:
+        c = c % field.characteristic
 
     if np.isscalar(c):
         # TODO: Sometimes the scalar c is a float?
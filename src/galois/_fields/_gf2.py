@@ -4,7 +4,11 @@ A module that defines the GF(2) array class.
 
 from __future__ import annotations
 
+import sys
+
+import numba
 import numpy as np
+from typing_extensions import Literal, Self
 
 from .._domains._lookup import (
     add_ufunc,
@@ -19,6 +23,7 @@ from .._domains._lookup import (
 )
 from .._domains._ufunc import UFuncMixin, matmul_ufunc
 from .._helper import export
+from ..typing import ArrayLike, DTypeLike, ElementLike
 from ._array import FieldArray
 
 
@@ -100,41 +105,325 @@ class UFuncMixin_2_1(UFuncMixin):
         cls._log = log(cls)
         cls._sqrt = sqrt(cls)
 
-class add_ufunc_bitpacked(add_ufunc):
+def _parity(words: np.ndarray) -> np.ndarray:
     """
-    Addition ufunc dispatcher w/ support for bit-packed fields.
+    Computes the bit parity of each uint64 word with a logarithmic XOR shift-fold.
+
+    This is pure bitwise work that stays on NumPy's SIMD path, unlike a popcount followed by a modulo,
+    and it avoids the integer widening that np.bitwise_count performs. The folds run in place through a
+    single scratch buffer, so `words` is consumed -- callers pass freshly-computed temporaries.
+    """
+    scratch = np.empty_like(words)
+    for shift in (np.uint64(32), np.uint64(16), np.uint64(8), np.uint64(4), np.uint64(2), np.uint64(1)):
+        np.right_shift(words, shift, out=scratch)
+        np.bitwise_xor(words, scratch, out=words)
+    np.bitwise_and(words, np.uint64(1), out=words)
+    return words.astype(np.uint8)
+
+
+# Delta-swap masks/shifts that transpose an 8x8 bit matrix held in a uint64 word (Hacker's Delight 7-3),
+# with byte 0 of the word being row 0 of the tile (most significant byte first).
+_TRANSPOSE_MASKS = (
+    (np.uint64(0x00AA00AA00AA00AA), np.uint64(7)),
+    (np.uint64(0x0000CCCC0000CCCC), np.uint64(14)),
+    (np.uint64(0x00000000F0F0F0F0), np.uint64(28)),
+)
+
+
+def _bit_transpose_packed(packed: np.ndarray, num_rows: int, num_cols: int) -> np.ndarray:
+    """
+    Transposes a bit-packed matrix without unpacking it.
+
+    The input has shape `(num_rows, ceil(num_cols / 8))` with each row bit-packed along the last axis
+    (most significant bit first, as with np.packbits). The matrix is processed as 8x8 bit tiles, each held
+    in one uint64 word and transposed with three vectorized delta-swap rounds, avoiding the 8x memory
+    expansion of an unpackbits/packbits round trip. Returns shape `(num_cols, ceil(num_rows / 8))`.
+    """
+    pad_rows = -num_rows % 8
+    if pad_rows > 0:
+        packed = np.vstack([packed, np.zeros((pad_rows, packed.shape[-1]), dtype=np.uint8)])
+    num_tile_rows = packed.shape[0] // 8
+    num_bytes = packed.shape[-1]
+
+    # Gather each 8x8 bit tile into a uint64 word with tile row 0 in the most significant byte, which is
+    # what the delta-swap masks assume. On little-endian machines this is done by loading the rows in
+    # reverse order, folding the byte-order fixup into the gather instead of separate byteswap passes.
+    row_order = slice(None, None, -1) if sys.byteorder == "little" else slice(None)
+    tiles = packed.reshape(num_tile_rows, 8, num_bytes)[:, row_order, :].transpose(0, 2, 1)
+    words = np.ascontiguousarray(tiles).view(np.uint64)[..., 0]
+    # Run the delta swaps through one reused scratch buffer so each round is pure SIMD bitwise work with
+    # no fresh temporaries.
+    t = np.empty_like(words)
+    for mask, shift in _TRANSPOSE_MASKS:
+        np.right_shift(words, shift, out=t)
+        np.bitwise_xor(words, t, out=t)
+        np.bitwise_and(t, mask, out=t)
+        np.bitwise_xor(words, t, out=words)
+        np.left_shift(t, shift, out=t)
+        np.bitwise_xor(words, t, out=words)
+
+    out = np.ascontiguousarray(words.transpose()).view(np.uint8)
+    out = np.ascontiguousarray(out.reshape(num_bytes, num_tile_rows, 8)[:, :, row_order].transpose(0, 2, 1))
+    return out.reshape(num_bytes * 8, num_tile_rows)[:num_cols]
+
+
+def _get_packed_cols(b: GF2BP) -> np.ndarray:
+    """
+    Returns the column-packed transpose of a 2-D bit-packed matrix.
+
+    If the operand was pre-packed with `GF2BP.prepack_cols()`, the cached transpose is reused. Otherwise
+    it is computed fresh on every call -- mutation through views or `out=` writes to the underlying
+    buffer cannot be detected, so an implicit cache would silently corrupt later products.
+    """
+    packed_cols = getattr(b, "_packed_cols", None)
+    if packed_cols is None:
+        K, P = b._unpacked_shape
+        packed_cols = _bit_transpose_packed(b.view(np.ndarray), K, P)
+    return packed_cols
+
+
+def _to_uint64_words(packed: np.ndarray) -> np.ndarray:
+    """
+    Reinterprets a uint8 bit-packed array as uint64 words, zero-padding the last axis to a multiple of 8 bytes.
+
+    Bitwise AND/XOR and popcounts are agnostic to byte order, so the words may be operated on directly. This gives
+    NumPy's C loops 8x the bits per element compared to the uint8 representation.
+    """
+    num_bytes = packed.shape[-1]
+    pad = -num_bytes % 8
+    if pad > 0:
+        packed = np.concatenate([packed, np.zeros(packed.shape[:-1] + (pad,), dtype=np.uint8)], axis=-1)
+    elif not packed.flags.c_contiguous:
+        packed = np.ascontiguousarray(packed)
+    return packed.view(np.uint64)
+
+
+class elementwise_ufunc_bitpacked:
+    """
+    A mixin for elementwise ufunc dispatchers that operate directly on the packed representation.
+
+    Elementwise arithmetic maps packed bytes to packed bytes, so the output's unpacked shape is that of
+    the inputs and only needs to be propagated once here rather than in each dispatcher.
     """
     def __call__(self, ufunc, method, inputs, kwargs, meta):
+        if (
+            self.override is not None
+            and method == "__call__"
+            and "out" not in kwargs
+            and all(hasattr(x, "_unpacked_shape") for x in inputs)
+        ):
+            # All operands are already packed uint8 arrays of this field, so apply the overriding NumPy
+            # ufunc to the underlying bytes directly. This skips the base class's verification and its
+            # output `astype(dtype)`, which copies every packed array even when the dtype already matches.
+            output = self.field._view(self.override(*(x.view(np.ndarray) for x in inputs), **kwargs))
+            output._unpacked_shape = inputs[0]._unpacked_shape
+            return output
+
         output = super().__call__(ufunc, method, inputs, kwargs, meta)
-        output.original_shape = inputs[0].original_shape
+        output._unpacked_shape = inputs[0]._unpacked_shape
         return output
 
-class subtract_ufunc_bitpacked(subtract_ufunc):
+class add_ufunc_bitpacked(elementwise_ufunc_bitpacked, add_ufunc):
+    """
+    Addition ufunc dispatcher w/ support for bit-packed fields.
+    """
+
+class subtract_ufunc_bitpacked(elementwise_ufunc_bitpacked, subtract_ufunc):
     """
     Subtraction ufunc dispatcher w/ support for bit-packed fields.
     """
-    def __call__(self, ufunc, method, inputs, kwargs, meta):
-        output = super().__call__(ufunc, method, inputs, kwargs, meta)
-        output.original_shape = inputs[0].original_shape
-        return output
 
-class multiply_ufunc_bitpacked(multiply_ufunc):
+class multiply_ufunc_bitpacked(elementwise_ufunc_bitpacked, multiply_ufunc):
     """
     Multiply ufunc dispatcher w/ support for bit-packed fields.
     """
-    def __call__(self, ufunc, method, inputs, kwargs, meta):
-        output = super().__call__(ufunc, method, inputs, kwargs, meta)
-        output.original_shape = inputs[0].original_shape
-        return output
 
-class divide_ufunc_bitpacked(divide):
+class divide_ufunc_bitpacked(elementwise_ufunc_bitpacked, divide):
     """
     Divide ufunc dispatcher w/ support for bit-packed fields.
     """
-    def __call__(self, ufunc, method, inputs, kwargs, meta):
-        output = super().__call__(ufunc, method, inputs, kwargs, meta)
-        output.original_shape = inputs[0].original_shape
-        return output
+
+@numba.njit("void(uint64[:,::1], uint64[:,::1], uint8[:,::1])", parallel=True, cache=True)
+def _matmul_bitpacked_kernel(a, b_cols, out):  # pragma: no cover
+    """
+    Fused popcount-parity matmul kernel over packed uint64 words.
+
+    `a` is row-packed (M, num_words), `b_cols` is column-packed (P, num_words), and `out` is a zeroed
+    byte-packed (M, ceil(P / 8)) output. Each output bit is computed in one streaming pass with no
+    temporaries: XOR-accumulating the ANDed words preserves popcount parity, and a final shift-fold
+    reduces the accumulator word to a single parity bit.
+    """
+    num_rows, num_words = a.shape
+    num_cols = b_cols.shape[0]
+    for i in numba.prange(num_rows):
+        for j in range(num_cols):
+            acc = np.uint64(0)
+            for k in range(num_words):
+                acc ^= a[i, k] & b_cols[j, k]
+            acc ^= acc >> np.uint64(32)
+            acc ^= acc >> np.uint64(16)
+            acc ^= acc >> np.uint64(8)
+            acc ^= acc >> np.uint64(4)
+            acc ^= acc >> np.uint64(2)
+            acc ^= acc >> np.uint64(1)
+            out[i, j >> 3] |= np.uint8((acc & np.uint64(1)) << (7 - (j & 7)))
+
+
+# Shape-specialized matmul kernels, keyed on (M, num_words, P). Hard-coded loop bounds let LLVM fully
+# unroll the inner word loop and remove stride math, which matters in the small-shape regime where
+# dispatch overhead dominates. Compilation only pays for itself on repeated shapes, so a shape must be
+# seen several times before its kernel is generated.
+_specialized_kernels = {}
+_specialized_shape_counts = {}
+_SPECIALIZE_MIN_CALLS = 8
+_SPECIALIZE_MAX_KERNELS = 64
+
+_SPECIALIZED_KERNEL_TEMPLATE = """
+@numba.njit("void(uint64[:,::1], uint64[:,::1], uint8[:,::1])", boundscheck=False)
+def kernel(a, b_cols, out):
+    for i in range({num_rows}):
+        for j in range({num_cols}):
+            acc = np.uint64(0)
+            for k in range({num_words}):
+                acc ^= a[i, k] & b_cols[j, k]
+            acc ^= acc >> np.uint64(32)
+            acc ^= acc >> np.uint64(16)
+            acc ^= acc >> np.uint64(8)
+            acc ^= acc >> np.uint64(4)
+            acc ^= acc >> np.uint64(2)
+            acc ^= acc >> np.uint64(1)
+            out[i, j >> 3] |= np.uint8((acc & np.uint64(1)) << (7 - (j & 7)))
+"""
+
+
+def _get_specialized_matmul_kernel(num_rows, num_words, num_cols):
+    """
+    Returns the matmul kernel specialized to these exact loop bounds, or None if this shape has not yet
+    repeated enough times for compilation to amortize.
+    """
+    key = (num_rows, num_words, num_cols)
+    kernel = _specialized_kernels.get(key)
+    if kernel is not None:
+        return kernel
+
+    if len(_specialized_kernels) >= _SPECIALIZE_MAX_KERNELS:
+        # The kernel cache is full, so this shape can never compile -- don't grow the counts dict either.
+        return None
+
+    count = _specialized_shape_counts.get(key, 0) + 1
+    _specialized_shape_counts[key] = count
+    if count < _SPECIALIZE_MIN_CALLS:
+        return None
+
+    namespace = {"numba": numba, "np": np}
+    exec(  # noqa: S102
+        _SPECIALIZED_KERNEL_TEMPLATE.format(num_rows=num_rows, num_words=num_words, num_cols=num_cols),
+        namespace,
+    )
+    kernel = _specialized_kernels[key] = namespace["kernel"]
+    del _specialized_shape_counts[key]  # The count has served its purpose once the kernel exists
+    return kernel
+
+
+# Minimum M * K * P before the Four-Russians matmul is preferred over the broadcasted popcount-parity matmul
+_M4RM_THRESHOLD = 2**18
+
+# Minimum M * K * P before the parallel JIT kernel is preferred over the Four-Russians matmul
+_JIT_THRESHOLD = 2**20
+
+# Minimum of all three matmul dimensions before the Strassen recursion is attempted, and the dimension
+# at which the recursion bottoms out into the fused JIT kernel
+_STRASSEN_MIN_DIM = 8192
+_STRASSEN_CUTOFF = 1024
+
+# Minimum M * K * P before attempting to offload the matmul to a CUDA device. Below this, host-device
+# transfer outweighs the compute win.
+_CUPY_THRESHOLD = 2**40
+
+_cupy_module = False  # False = not yet probed, None = probed and unavailable
+
+
+def _get_cupy():
+    """
+    Returns the cupy module if it is importable and a CUDA device is present, else None. CuPy is an
+    optional dependency, so the probe result is cached and failures of any kind disable the GPU path.
+    """
+    global _cupy_module
+    if _cupy_module is False:
+        try:
+            import cupy
+
+            cupy.cuda.runtime.getDeviceCount()
+            _cupy_module = cupy
+        except Exception:
+            _cupy_module = None
+    return _cupy_module
+
+
+def _matmul_words_chunked(xp, a_words, b_words, P: int, out: np.ndarray, budget: int = 2**25) -> None:
+    """
+    Runs the AND / XOR-reduce / parity-fold / pack matmul pipeline over packed uint64 words with the
+    array module `xp` (NumPy or CuPy), writing packed bytes into the host array `out`.
+
+    Rows of `a_words` are processed in chunks so the broadcasted (chunk, P, num_words) uint64
+    intermediate stays within `budget` words (~256 MiB at the default). With CuPy the intermediates
+    live on the device and only the (8x smaller) packed bytes transfer back per chunk.
+    """
+    M, num_words = a_words.shape
+    num_bytes = out.shape[-1]
+    chunk = max(1, budget // max(1, P * num_words))
+    shifts = tuple(xp.uint64(s) for s in (32, 16, 8, 4, 2, 1))
+    pack_weights = xp.left_shift(xp.uint8(1), xp.arange(7, -1, -1, dtype=xp.uint8))
+    for start in range(0, M, chunk):
+        acc = xp.bitwise_xor.reduce(a_words[start : start + chunk, None, :] & b_words[None, :, :], axis=-1)
+        for shift in shifts:
+            acc ^= acc >> shift
+        bits = (acc & xp.uint64(1)).astype(xp.uint8)
+        if num_bytes * 8 > P:
+            pad = xp.zeros((bits.shape[0], num_bytes * 8 - P), dtype=xp.uint8)
+            bits = xp.concatenate([bits, pad], axis=1)
+        # CuPy's packbits has no axis support, so pack manually: each group of 8 bits has disjoint
+        # set bits after weighting, so a uint8 sum reassembles the byte exactly.
+        packed = (bits.reshape(bits.shape[0], num_bytes, 8) * pack_weights).sum(axis=-1, dtype=xp.uint8)
+        out[start : start + chunk] = packed if xp is np else xp.asnumpy(packed)
+
+
+def _strassen_base(a: np.ndarray, b: np.ndarray, K: int, P: int) -> np.ndarray:
+    """
+    Multiplies row-packed `a` (M, K // 8) by row-packed `b` (K, P // 8) with the fused JIT kernel.
+    """
+    b_cols = _bit_transpose_packed(b, K, P)
+    out = np.zeros((a.shape[0], P // 8), dtype=np.uint8)
+    _matmul_bitpacked_kernel(_to_uint64_words(np.ascontiguousarray(a)), _to_uint64_words(b_cols), out)
+    return out
+
+
+def _strassen_recursive(a: np.ndarray, b: np.ndarray, K: int, depth: int) -> np.ndarray:
+    """
+    Strassen recursion on row-packed operands. The caller pads all dimensions so they stay byte-aligned
+    for exactly `depth` halvings. In GF(2) addition and subtraction are both XOR, so the seven products
+    combine with pure bitwise ops on the packed bytes.
+    """
+    M, P = a.shape[0], b.shape[1] * 8
+    if depth == 0:
+        return _strassen_base(a, b, K, P)
+
+    m, kb, pb, k2 = M // 2, a.shape[1] // 2, b.shape[1] // 2, K // 2
+    a11, a12, a21, a22 = a[:m, :kb], a[:m, kb:], a[m:, :kb], a[m:, kb:]
+    b11, b12, b21, b22 = b[:k2, :pb], b[:k2, pb:], b[k2:, :pb], b[k2:, pb:]
+
+    m1 = _strassen_recursive(a11 ^ a22, b11 ^ b22, k2, depth - 1)
+    m2 = _strassen_recursive(a21 ^ a22, b11, k2, depth - 1)
+    m3 = _strassen_recursive(a11, b12 ^ b22, k2, depth - 1)
+    m4 = _strassen_recursive(a22, b21 ^ b11, k2, depth - 1)
+    m5 = _strassen_recursive(a11 ^ a12, b22, k2, depth - 1)
+    m6 = _strassen_recursive(a21 ^ a11, b11 ^ b12, k2, depth - 1)
+    m7 = _strassen_recursive(a12 ^ a22, b21 ^ b22, k2, depth - 1)
+
+    top = np.concatenate([m1 ^ m4 ^ m5 ^ m7, m3 ^ m5], axis=1)
+    bottom = np.concatenate([m2 ^ m4, m1 ^ m2 ^ m3 ^ m6], axis=1)
+    return np.concatenate([top, bottom], axis=0)
+
 
 class matmul_ufunc_bitpacked(matmul_ufunc):
     """
@@ -143,27 +432,126 @@ class matmul_ufunc_bitpacked(matmul_ufunc):
     def __call__(self, ufunc, method, inputs, kwargs, meta):
         a, b = inputs
 
-        if hasattr(a, "original_shape"):
-            a = np.unpackbits(a.view(np.ndarray), axis=-1, count=a.original_shape[-1]).view(GF2BP)
-        if hasattr(b, "original_shape"):
-            b = np.unpackbits(b.view(np.ndarray), axis=-1, count=b.original_shape[-1]).view(GF2BP)
+        if (
+            hasattr(a, "_unpacked_shape")
+            and hasattr(b, "_unpacked_shape")
+            and len(a._unpacked_shape) == 2
+            and len(b._unpacked_shape) == 1
+        ):
+            # Matrix-vector multiplication: one parity bit per row of `a`, computed on the packed words
+            # without the 8x expansion of unpacking either operand.
+            (M, K), (K2,) = a._unpacked_shape, b._unpacked_shape
+            if not K == K2:
+                raise ValueError(
+                    f"Operation 'matmul' requires the last dimension of 'A' to match the second-to-last "
+                    f"dimension of 'B', not {a._unpacked_shape} and {b._unpacked_shape}."
+                )
+            a_words = _to_uint64_words(a.view(np.ndarray))
+            b_words = _to_uint64_words(b.view(np.ndarray))
+            bits = _parity(np.bitwise_xor.reduce(a_words & b_words, axis=-1))
+            output = self.field._view(np.packbits(bits))
+            output._unpacked_shape = (M,)
+            return output
+
+        if (
+            hasattr(a, "_unpacked_shape")
+            and hasattr(b, "_unpacked_shape")
+            and len(a._unpacked_shape) == 1
+            and len(b._unpacked_shape) == 2
+        ):
+            # Vector-matrix multiplication: a @ B == rows of B^T dotted against `a`, so column-pack `b`
+            # and reduce as in the matrix-vector case.
+            (K,), (K2, P) = a._unpacked_shape, b._unpacked_shape
+            if not K == K2:
+                raise ValueError(
+                    f"Operation 'matmul' requires the last dimension of 'A' to match the second-to-last "
+                    f"dimension of 'B', not {a._unpacked_shape} and {b._unpacked_shape}."
+                )
+            a_words = _to_uint64_words(a.view(np.ndarray))
+            b_words = _to_uint64_words(_get_packed_cols(b))
+            bits = _parity(np.bitwise_xor.reduce(b_words & a_words, axis=-1))
+            output = self.field._view(np.packbits(bits))
+            output._unpacked_shape = (P,)
+            return output
+
+        if (
+            hasattr(a, "_unpacked_shape")
+            and hasattr(b, "_unpacked_shape")
+            and len(a._unpacked_shape) == 2
+            and len(b._unpacked_shape) == 2
+        ):
+            # Matrix-matrix multiplication directly on the packed representation. Rows of `a` are already
+            # packed along the last axis, so repack `b` along its columns. Each output bit is then the parity
+            # of the popcount of the AND of two packed rows, computed for all (M, P) pairs in one broadcasted
+            # NumPy pass (any padding bits are zero and do not affect the result).
+            (M, K), (K2, P) = a._unpacked_shape, b._unpacked_shape
+            if not K == K2:
+                raise ValueError(
+                    f"Operation 'matmul' requires the last dimension of 'A' to match the second-to-last "
+                    f"dimension of 'B', not {a._unpacked_shape} and {b._unpacked_shape}."
+                )
+            if M * K * P >= _CUPY_THRESHOLD and _get_cupy() is not None:
+                # Huge products are worth the PCIe round trip when a CUDA device is available.
+                return self.field._matmul_cupy(a, b)
+
+            if min(M, K, P) >= _STRASSEN_MIN_DIM:
+                # Very large products benefit from trading block products for cheap packed XORs.
+                return self.field._strassen(a, b)
+
+            if M * K * P >= _JIT_THRESHOLD:
+                # Large products are dominated by memory traffic, so stream each output bit through the
+                # fused parallel kernel with no intermediate arrays.
+                a_words = _to_uint64_words(a.view(np.ndarray))
+                b_words = _to_uint64_words(_get_packed_cols(b))
+                out = np.zeros((M, (P + 7) // 8), dtype=np.uint8)
+                _matmul_bitpacked_kernel(a_words, b_words, out)
+                output = self.field._view(out)
+                output._unpacked_shape = (M, P)
+                return output
+
+            if M * K * P >= _M4RM_THRESHOLD:
+                # The Four-Russians table construction amortizes for larger products.
+                return self.field._m4rm(a, b)
+
+            a_words = _to_uint64_words(a.view(np.ndarray))
+            b_words = _to_uint64_words(_get_packed_cols(b))
+
+            kernel = _get_specialized_matmul_kernel(M, a_words.shape[-1], P)
+            if kernel is not None:
+                out = np.zeros((M, (P + 7) // 8), dtype=np.uint8)
+                kernel(a_words, b_words, out)
+                output = self.field._view(out)
+                output._unpacked_shape = (M, P)
+                return output
+
+            # XOR-reducing the ANDed words preserves popcount parity, so one fold per output element
+            # replaces a popcount and modulo over all words.
+            bits = _parity(np.bitwise_xor.reduce(a_words[:, np.newaxis, :] & b_words[np.newaxis, :, :], axis=-1))
+            output = self.field._view(np.packbits(bits, axis=-1))
+            output._unpacked_shape = (M, P)
+            return output
+
+        if hasattr(a, "_unpacked_shape"):
+            a = np.unpackbits(a.view(np.ndarray), axis=-1, count=a._unpacked_shape[-1]).view(GF2BP)
+        if hasattr(b, "_unpacked_shape"):
+            b = np.unpackbits(b.view(np.ndarray), axis=-1, count=b._unpacked_shape[-1]).view(GF2BP)
 
         inputs = (a, b)
         output = super().__call__(ufunc, method, inputs, kwargs, meta)
-        original_shape = output.shape
+        unpacked_shape = output.shape
         output = self.field._view(np.packbits(output.view(np.ndarray), axis=-1))
-        output.original_shape = original_shape
+        output._unpacked_shape = unpacked_shape
 
         return output
 
 
 def array_equal_bitpacked(a: FieldArray, b: FieldArray) -> bool:
     if a.shape != b.shape:
-        if hasattr(a, "original_shape"):
-            a = np.unpackbits(a.view(np.ndarray), axis=-1, count=a.original_shape[-1])
+        if hasattr(a, "_unpacked_shape"):
+            a = np.unpackbits(a.view(np.ndarray), axis=-1, count=a._unpacked_shape[-1])
 
-        if hasattr(b, "original_shape"):
-            b = np.unpackbits(b.view(np.ndarray), axis=-1, count=b.original_shape[-1])
+        if hasattr(b, "_unpacked_shape"):
+            b = np.unpackbits(b.view(np.ndarray), axis=-1, count=b._unpacked_shape[-1])
 
     return np.core.numeric.array_equal(a, b)
 
@@ -288,6 +676,156 @@ class GF2BP(
         galois-fields
     """
 
+    def __new__(
+        cls,
+        x: ElementLike | ArrayLike,
+        dtype: DTypeLike | None = None,
+        copy: bool = True,
+        order: Literal["K", "A", "C", "F"] = "K",
+        ndmin: int = 0,
+    ) -> Self:
+        if isinstance(x, GF2BP):
+            # Already bit-packed -- running the packed bytes through np.packbits again would corrupt them.
+            array = cls._view(x.view(np.ndarray).copy() if copy else x.view(np.ndarray))
+            array._unpacked_shape = x._unpacked_shape
+            return array
+        if isinstance(x, GF2):
+            # A GF2 array's elements were verified as 0/1 at its construction, so re-verification is pure
+            # overhead -- pack the underlying integer array directly.
+            array = cls._view(np.packbits(x.view(np.ndarray), axis=-1))
+            array._unpacked_shape = x.shape
+            return array
+        if isinstance(x, np.ndarray) and not isinstance(x, FieldArray) and x.dtype in (np.uint8, np.bool_):
+            # Fast path for uint8 or bool arrays, e.g. those produced elsewhere in the library. A uint8
+            # array is verified with a single max() reduction, which avoids the intermediate boolean
+            # allocations of the generic verification pass; bool arrays cannot hold invalid elements.
+            if x.dtype == np.uint8 and x.size > 0 and x.max() > 1:
+                values = x[x > 1]
+                raise ValueError(f"{cls.name} arrays must have elements in `0 <= x < {cls.order}`, not {values}.")
+            array = cls._view(np.packbits(x, axis=-1))
+            array._unpacked_shape = x.shape
+            return array
+        return super().__new__(cls, x, dtype=dtype, copy=copy, order=order, ndmin=ndmin)
+
+    def __array_finalize__(self, obj):
+        """
+        In addition to the base class verification, propagate the unpacked shape through views and copies
+        so NumPy-created outputs retain the bit-packed metadata.
+        """
+        super().__array_finalize__(obj)
+        if obj is not None and hasattr(obj, "_unpacked_shape"):
+            self._unpacked_shape = obj._unpacked_shape
+
+    def __setitem__(self, key, value):
+        # Mutating the array invalidates the pre-packed column transpose used by matmul.
+        self._packed_cols = None
+        super().__setitem__(key, value)
+
+    def prepack_cols(self) -> Self:
+        r"""
+        Computes and caches the column-packed transpose used by matrix multiplication.
+
+        Workloads such as encoders repeatedly multiply against the same right operand. Pre-packing that
+        operand computes its transpose once instead of on every product. The cache is cleared when the
+        array is mutated with `__setitem__()`, but writes through views or `out=` arguments to the
+        underlying buffer cannot be detected -- do not pre-pack operands mutated in those ways.
+        """
+        K, P = self._unpacked_shape
+        self._packed_cols = _bit_transpose_packed(self.view(np.ndarray), K, P)
+        return self
+
+    @classmethod
+    def _strassen(cls, a: GF2BP, b: GF2BP, cutoff: int = _STRASSEN_CUTOFF) -> GF2BP:
+        r"""
+        Computes the matrix product of two bit-packed matrices with Strassen's recursion.
+
+        Each level trades one of the eight block products for XORs of packed blocks, which are nearly
+        free relative to the products, giving $O(N^{2.81})$ bit operations. The recursion bottoms out in
+        the fused JIT kernel once a dimension reaches `cutoff`. Operands are zero-padded up front so all
+        splits stay byte-aligned; padding contributes nothing to the product and is trimmed at the end.
+        """
+        (M, K), (_, P) = a._unpacked_shape, b._unpacked_shape
+
+        levels = 0
+        while min(M, K, P) >> (levels + 1) > cutoff:
+            levels += 1
+        row_align, col_align = 2**levels, 2**levels * 8
+
+        a_packed, b_packed = a.view(np.ndarray), b.view(np.ndarray)
+        Mp, Kp, Pp = -(-M // row_align) * row_align, -(-K // col_align) * col_align, -(-P // col_align) * col_align
+        padded_a = np.zeros((Mp, Kp // 8), dtype=np.uint8)
+        padded_a[:M, : a_packed.shape[1]] = a_packed
+        padded_b = np.zeros((Kp, Pp // 8), dtype=np.uint8)
+        padded_b[:K, : b_packed.shape[1]] = b_packed
+
+        out = _strassen_recursive(padded_a, padded_b, Kp, levels)
+        output = cls._view(np.ascontiguousarray(out[:M, : (P + 7) // 8]))
+        output._unpacked_shape = (M, P)
+        return output
+
+    @classmethod
+    def _m4rm(cls, a: GF2BP, b: GF2BP) -> GF2BP:
+        r"""
+        Computes the matrix product of two bit-packed matrices with the Method of the Four Russians (M4RM).
+
+        All $2^k$ linear combinations of $k$ rows of $b$ are tabulated (one vectorized XOR per table half),
+        then each $k$-bit field of a row of $a$ selects a table entry to XOR into the output row. This
+        reduces the bit-operation count from $O(MKP)$ to $O(MKP / \log K)$.
+        """
+        (M, K), (_, P) = a._unpacked_shape, b._unpacked_shape
+        a_bits = np.unpackbits(a.view(np.ndarray), axis=-1, count=K)
+        b_words = _to_uint64_words(b.view(np.ndarray))
+        num_bytes = b.view(np.ndarray).shape[-1]
+        num_words = b_words.shape[-1]
+
+        # Allocate the packed output once and accumulate through a uint64 view of the same buffer, so no
+        # trailing repack or copy is needed (any word-padding bytes are sliced off the returned view).
+        out_bytes = np.zeros((M, num_words * 8), dtype=np.uint8)
+        out_words = out_bytes.view(np.uint64)
+
+        k = max(1, min(8, K.bit_length() - 1))
+        # Reuse one contiguous scratch buffer for the table gathers so the accumulation loop is bulk
+        # XORs over aligned memory with no per-block allocations.
+        gathered = np.empty((M, num_words), dtype=np.uint64)
+        for start in range(0, K, k):
+            rows = b_words[start : start + k]
+            kk = rows.shape[0]
+            # Table of all 2^kk XOR combinations of these rows of `b`. Each row of `b` is XORed into the
+            # half of the table whose index has the corresponding bit set.
+            table = np.zeros((2**kk, num_words), dtype=np.uint64)
+            for j in range(kk):
+                selected = (np.arange(2**kk) >> (kk - 1 - j)) & 1 == 1
+                table[selected] ^= rows[j]
+            weights = 1 << np.arange(kk - 1, -1, -1, dtype=np.uint32)
+            indices = a_bits[:, start : start + kk] @ weights
+            np.take(table, indices, axis=0, out=gathered)
+            np.bitwise_xor(out_words, gathered, out=out_words)
+
+        output = cls._view(out_bytes[:, :num_bytes] if num_words * 8 > num_bytes else out_bytes)
+        output._unpacked_shape = (M, P)
+        return output
+
+    @classmethod
+    def _matmul_cupy(cls, a: GF2BP, b: GF2BP) -> GF2BP:
+        r"""
+        Computes the matrix product of two bit-packed matrices on a CUDA device with CuPy.
+
+        Both packed operands are transferred to the device as uint64 words, where the AND / XOR-reduce /
+        parity-fold pipeline of `_matmul_words_chunked()` runs as elementwise kernels, chunked to stay
+        within a fixed device-memory budget.
+        """
+        cp = _get_cupy()
+        (M, _), (_, P) = a._unpacked_shape, b._unpacked_shape
+
+        a_words = cp.asarray(_to_uint64_words(a.view(np.ndarray)))
+        b_words = cp.asarray(_to_uint64_words(_get_packed_cols(b)))
+        out = np.empty((M, (P + 7) // 8), dtype=np.uint8)
+        _matmul_words_chunked(cp, a_words, b_words, P, out)
+
+        output = cls._view(out)
+        output._unpacked_shape = (M, P)
+        return output
+
 
 GF2._default_ufunc_mode = "jit-calculate"
 GF2._ufunc_modes = ["jit-calculate", "python-calculate"]
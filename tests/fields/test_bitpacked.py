@@ -0,0 +1,253 @@
+"""
+A pytest module to test the bit-packed GF(2) array class.
+"""
+
+import numpy as np
+import pytest
+
+import galois
+
+GF2 = galois.GF2
+GF2BP = galois.GF2BP
+
+
+def unpack(x):
+    """
+    Unpacks a bit-packed GF(2) array back to a plain NumPy 0/1 array.
+    """
+    unpacked = np.unpackbits(x.view(np.ndarray), axis=-1, count=x._unpacked_shape[-1])
+    return unpacked.reshape(x._unpacked_shape)
+
+
+def random_bits(shape, seed):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 2, shape, dtype=np.uint8)
+
+
+def test_construction_packs_last_axis():
+    x = random_bits((5, 12), seed=1)
+    a = GF2BP(x)
+    assert a._unpacked_shape == (5, 12)
+    assert a.view(np.ndarray).shape == (5, 2)
+    assert np.array_equal(unpack(a), x)
+
+
+@pytest.mark.parametrize(
+    "shapes",
+    [
+        ((8, 8), (8, 8)),
+        ((4, 16), (16, 24)),
+        ((5, 12), (12, 7)),
+        ((1, 9), (9, 3)),
+        ((17, 31), (31, 19)),
+        ((64, 100), (100, 50)),
+    ],
+)
+def test_matmul_matrix_matrix(shapes):
+    shape_a, shape_b = shapes
+    x = random_bits(shape_a, seed=sum(shape_a))
+    y = random_bits(shape_b, seed=sum(shape_b))
+
+    c = GF2BP(x) @ GF2BP(y)
+    c_truth = GF2(x) @ GF2(y)
+
+    assert c._unpacked_shape == (shape_a[0], shape_b[1])
+    assert np.array_equal(unpack(c), c_truth.view(np.ndarray))
+
+
+def test_matmul_shape_mismatch():
+    a = GF2BP(random_bits((4, 8), seed=1))
+    b = GF2BP(random_bits((9, 3), seed=2))
+    with pytest.raises(ValueError):
+        a @ b
+
+
+def test_add_and_multiply():
+    x = random_bits((6, 10), seed=3)
+    y = random_bits((6, 10), seed=4)
+    a = GF2BP(x)
+    b = GF2BP(y)
+
+    assert np.array_equal(unpack(a + b), np.bitwise_xor(x, y))
+    assert np.array_equal(unpack(a - b), np.bitwise_xor(x, y))
+    assert np.array_equal(unpack(a * b), np.bitwise_and(x, y))
+
+
+@pytest.mark.parametrize("shapes", [((30, 40), (40, 25)), ((100, 129), (129, 200)), ((1, 65), (65, 1))])
+def test_m4rm(shapes):
+    shape_a, shape_b = shapes
+    x = random_bits(shape_a, seed=5)
+    y = random_bits(shape_b, seed=6)
+
+    c = GF2BP._m4rm(GF2BP(x), GF2BP(y))
+    c_truth = GF2(x) @ GF2(y)
+
+    assert c._unpacked_shape == (shape_a[0], shape_b[1])
+    assert np.array_equal(unpack(c), c_truth.view(np.ndarray))
+
+
+@pytest.mark.parametrize("shape", [(8, 8), (9, 13), (1, 1), (64, 64), (100, 37), (5, 80)])
+def test_bit_transpose_packed(shape):
+    from galois._fields._gf2 import _bit_transpose_packed
+
+    x = random_bits(shape, seed=7)
+    transposed = _bit_transpose_packed(np.packbits(x, axis=-1), *shape)
+    assert np.array_equal(transposed, np.packbits(x.transpose(), axis=-1))
+
+
+def test_matmul_large_uses_jit_kernel():
+    # Large enough to dispatch to the parallel JIT kernel
+    x = random_bits((150, 200), seed=8)
+    y = random_bits((200, 100), seed=9)
+
+    c = GF2BP(x) @ GF2BP(y)
+    c_truth = GF2(x) @ GF2(y)
+
+    assert np.array_equal(unpack(c), c_truth.view(np.ndarray))
+
+
+def test_construction_fast_path_uint8_and_bool():
+    x = random_bits((7, 11), seed=10)
+    a = GF2BP(x)
+    b = GF2BP(x.astype(np.bool_))
+    assert a._unpacked_shape == b._unpacked_shape == (7, 11)
+    assert np.array_equal(unpack(a), x)
+    assert np.array_equal(unpack(b), x)
+
+
+def test_construction_still_verifies_other_inputs():
+    with pytest.raises(ValueError):
+        GF2BP([0, 1, 2])
+    with pytest.raises(ValueError):
+        GF2BP(np.array([0, 1, 2], dtype=np.int64))
+    with pytest.raises(ValueError):
+        GF2BP(np.array([0, 1, 2], dtype=np.uint8))
+
+
+@pytest.mark.parametrize("shape", [(8, 8), (5, 12), (100, 129)])
+def test_matmul_matrix_vector(shape):
+    x = random_bits(shape, seed=11)
+    y = random_bits(shape[1], seed=12)
+
+    c = GF2BP(x) @ GF2BP(y)
+    c_truth = GF2(x) @ GF2(y)
+
+    assert c._unpacked_shape == (shape[0],)
+    assert np.array_equal(unpack(c), c_truth.view(np.ndarray))
+
+
+@pytest.mark.parametrize("shape", [(8, 8), (5, 12), (100, 129)])
+def test_matmul_vector_matrix(shape):
+    x = random_bits(shape[0], seed=13)
+    y = random_bits(shape, seed=14)
+
+    c = GF2BP(x) @ GF2BP(y)
+    c_truth = GF2(x) @ GF2(y)
+
+    assert c._unpacked_shape == (shape[1],)
+    assert np.array_equal(unpack(c), c_truth.view(np.ndarray))
+
+
+def test_construction_from_gf2():
+    x = random_bits((9, 21), seed=15)
+    a = GF2BP(GF2(x))
+    assert a._unpacked_shape == (9, 21)
+    assert np.array_equal(unpack(a), x)
+
+
+def test_construction_from_gf2bp():
+    x = random_bits((9, 21), seed=16)
+    a = GF2BP(x)
+    b = GF2BP(a)
+    assert b._unpacked_shape == a._unpacked_shape
+    assert np.array_equal(unpack(b), x)
+
+
+def test_matmul_uses_prepacked_transpose():
+    x = random_bits((5, 12), seed=17)
+    y = random_bits((12, 7), seed=18)
+    a = GF2BP(x)
+    b = GF2BP(y)
+
+    c1 = a @ b
+    assert getattr(b, "_packed_cols", None) is None  # Caching is opt-in
+    b.prepack_cols()
+    assert b._packed_cols is not None
+    c2 = a @ b
+    assert np.array_equal(unpack(c1), unpack(c2))
+
+
+def test_setitem_invalidates_prepacked_transpose():
+    x = random_bits((5, 12), seed=19)
+    y = random_bits((12, 7), seed=20)
+    a = GF2BP(x)
+    b = GF2BP(y).prepack_cols()
+
+    a @ b
+    b[0] = 1  # Mutate a packed byte, which changes 8 unpacked columns of row 0
+    assert b._packed_cols is None
+
+
+def test_matmul_correct_after_view_mutation():
+    x = random_bits((5, 12), seed=25)
+    y = random_bits((12, 7), seed=26)
+    a = GF2BP(x)
+    b = GF2BP(y)
+
+    a @ b
+    # Mutating through a view bypasses b's __setitem__, so no caching may have occurred implicitly
+    v = b[:]
+    v[0] = 1
+    c = a @ b
+    c_truth = GF2(x) @ GF2(unpack(b))
+    assert np.array_equal(unpack(c), c_truth.view(np.ndarray))
+
+
+def test_matmul_repeated_shape_uses_specialized_kernel():
+    x = random_bits((4, 12), seed=21)
+    y = random_bits((12, 6), seed=22)
+    a = GF2BP(x)
+    b = GF2BP(y)
+    c_truth = GF2(x) @ GF2(y)
+
+    # Enough repetitions of the same shape to trigger and then use the specialized kernel
+    for _ in range(12):
+        c = a @ b
+        assert np.array_equal(unpack(c), c_truth.view(np.ndarray))
+
+    from galois._fields._gf2 import _specialized_kernels
+
+    assert any(key[0] == 4 and key[2] == 6 for key in _specialized_kernels)
+
+
+@pytest.mark.parametrize("shapes", [((20, 30), (30, 24)), ((17, 65), (65, 13)), ((9, 8), (8, 40))])
+def test_matmul_words_chunked(shapes):
+    from galois._fields._gf2 import _bit_transpose_packed, _matmul_words_chunked, _to_uint64_words
+
+    shape_a, shape_b = shapes
+    x = random_bits(shape_a, seed=27)
+    y = random_bits(shape_b, seed=28)
+    M, P = shape_a[0], shape_b[1]
+
+    a_words = _to_uint64_words(np.packbits(x, axis=-1))
+    b_words = _to_uint64_words(_bit_transpose_packed(np.packbits(y, axis=-1), *shape_b))
+    out = np.empty((M, (P + 7) // 8), dtype=np.uint8)
+    # NumPy stands in for CuPy; a tiny budget forces multiple row chunks
+    _matmul_words_chunked(np, a_words, b_words, P, out, budget=64)
+
+    c_truth = GF2(x) @ GF2(y)
+    assert np.array_equal(np.unpackbits(out, axis=-1, count=P), c_truth.view(np.ndarray))
+
+
+@pytest.mark.parametrize("shapes", [((100, 90), (90, 120)), ((64, 64), (64, 64)), ((129, 200), (200, 65))])
+def test_strassen(shapes):
+    shape_a, shape_b = shapes
+    x = random_bits(shape_a, seed=23)
+    y = random_bits(shape_b, seed=24)
+
+    # A small cutoff forces actual recursion at test-sized inputs
+    c = GF2BP._strassen(GF2BP(x), GF2BP(y), cutoff=16)
+    c_truth = GF2(x) @ GF2(y)
+
+    assert c._unpacked_shape == (shape_a[0], shape_b[1])
+    assert np.array_equal(unpack(c), c_truth.view(np.ndarray))